@@ -0,0 +1,79 @@
+"""
+Numeric kernels for efficiency analysis
+
+Threshold predicates from the analyzer's hot loops, lifted onto NumPy
+arrays. Numba is optional, following the same pattern as _cost_kernels:
+when installed the predicates are JIT-compiled (and warmed at import so
+the first real call doesn't pay compilation latency); otherwise the
+plain NumPy array expressions run, which are already C-level.
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional speedup
+    njit = None
+
+
+def compute_masks(
+    cpu: np.ndarray,
+    memory: np.ndarray,
+    is_big: np.ndarray,
+    cpu_threshold: float,
+    memory_threshold: float,
+    over_prov_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flag underutilized and over-provisioned instances.
+
+    Args:
+        cpu: Per-instance CPU utilization percentages
+        memory: Per-instance memory utilization percentages
+        is_big: Per-instance flag for "big" instance-type sizes
+        cpu_threshold: CPU percentage below which an instance counts as underutilized
+        memory_threshold: Memory percentage below which an instance counts as underutilized
+        over_prov_threshold: CPU percentage below which a big instance counts as over-provisioned
+
+    Returns:
+        Tuple of (underutilized, over_provisioned) boolean masks
+    """
+    underutilized = (cpu < cpu_threshold) & (memory < memory_threshold)
+    over_provisioned = is_big & (cpu < over_prov_threshold)
+    return underutilized, over_provisioned
+
+
+def storage_masks(
+    size_gb: np.ndarray,
+    last_accessed: np.ndarray,
+    unused_days: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flag empty and unused storage buckets.
+
+    Args:
+        size_gb: Per-bucket sizes in GB
+        last_accessed: Per-bucket days since last access
+        unused_days: Day count beyond which a non-empty bucket counts as unused
+
+    Returns:
+        Tuple of (empty, unused) boolean masks; mutually exclusive, with
+        empty taking precedence as in the scalar path
+    """
+    empty = size_gb == 0
+    unused = ~empty & (last_accessed > unused_days)
+    return empty, unused
+
+
+if njit is not None:
+    compute_masks = njit(cache=True)(compute_masks)
+    storage_masks = njit(cache=True)(storage_masks)
+
+    # Warm the JIT at import time so the first real analysis doesn't pay
+    # the compilation latency
+    _f = np.zeros(1, dtype=np.float64)
+    _b = np.zeros(1, dtype=np.bool_)
+    compute_masks(_f, _f, _b, 0.0, 0.0, 0.0)
+    storage_masks(_f, _f, 0.0)
+    del _f, _b
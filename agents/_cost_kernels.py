@@ -0,0 +1,120 @@
+"""
+Numeric kernels for cost simulation
+
+Hot numeric loops used by the cost simulator. Numba is optional: when it
+is installed, large scenario sweeps run through a JIT-compiled kernel
+that fuses the per-scenario sum/cost/difference/percentage math into one
+parallel pass; otherwise an equivalent NumPy implementation is used.
+"""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional speedup
+    njit = None
+    prange = range
+
+# Sweeps below this size stay on the NumPy path even when Numba is
+# installed; the JIT call overhead isn't worth it for small batches.
+PARALLEL_MIN_SCENARIOS = 512
+
+
+def _score_scenarios_numpy(
+    current_monthly: float,
+    deltas: np.ndarray,
+    starts: np.ndarray,
+    counts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """NumPy implementation: whole-array segment sums and percentages"""
+    # Segment sums via prefix sums; unlike np.add.reduceat this handles
+    # zero-change scenarios correctly
+    prefix = np.concatenate(([0.0], np.cumsum(deltas)))
+    sums = prefix[starts + counts] - prefix[starts]
+
+    costs = current_monthly + sums
+    differences = costs - current_monthly
+
+    # Savings are measured against the baseline, increases against the
+    # scenario cost — matching calculate_savings_percentage in both
+    # directions, including its zero-denominator guard
+    with np.errstate(divide="ignore", invalid="ignore"):
+        savings_pct = np.where(
+            current_monthly != 0,
+            (current_monthly - costs) / current_monthly * 100.0,
+            0.0
+        )
+        increase_pct = np.where(
+            costs != 0,
+            -((costs - current_monthly) / costs * 100.0),
+            0.0
+        )
+    percentages = np.where(
+        costs < current_monthly,
+        savings_pct,
+        np.where(costs > current_monthly, increase_pct, 0.0)
+    )
+
+    return costs, differences, percentages
+
+
+def _score_scenarios_fused(
+    current_monthly: float,
+    deltas: np.ndarray,
+    starts: np.ndarray,
+    counts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fused single-pass kernel, JIT-compiled and parallelized by Numba"""
+    n = starts.shape[0]
+    costs = np.empty(n, dtype=np.float64)
+    differences = np.empty(n, dtype=np.float64)
+    percentages = np.empty(n, dtype=np.float64)
+
+    for i in prange(n):
+        total = 0.0
+        for j in range(starts[i], starts[i] + counts[i]):
+            total += deltas[j]
+
+        cost = current_monthly + total
+        costs[i] = cost
+        differences[i] = cost - current_monthly
+
+        if cost < current_monthly and current_monthly != 0:
+            percentages[i] = (current_monthly - cost) / current_monthly * 100.0
+        elif cost > current_monthly and cost != 0:
+            percentages[i] = -((cost - current_monthly) / cost * 100.0)
+        else:
+            percentages[i] = 0.0
+
+    return costs, differences, percentages
+
+
+if njit is not None:
+    _score_scenarios_fused = njit(parallel=True, fastmath=True, cache=True)(
+        _score_scenarios_fused
+    )
+
+
+def score_scenarios(
+    current_monthly: float,
+    deltas: np.ndarray,
+    starts: np.ndarray,
+    counts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score scenario sweeps against a baseline cost.
+
+    Args:
+        current_monthly: Baseline monthly cost
+        deltas: Per-change cost deltas, all scenarios concatenated
+        starts: Index of each scenario's first delta
+        counts: Number of deltas per scenario
+
+    Returns:
+        Tuple of (costs, differences, difference_percentages) arrays,
+        one entry per scenario
+    """
+    if njit is not None and starts.shape[0] >= PARALLEL_MIN_SCENARIOS:
+        return _score_scenarios_fused(current_monthly, deltas, starts, counts)
+    return _score_scenarios_numpy(current_monthly, deltas, starts, counts)
@@ -13,7 +13,208 @@ It extracts and structures the architecture information for use by other agents.
 
 from typing import Dict, Any, List
 from agents.base_agent import BaseAgent, AgentResult, AgentStatus
+from agents.llm_cache import LLMResponseCache
+import asyncio
+import gzip
+import hashlib
 import json
+import time
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available (3-10x faster than
+    stdlib json on large Terraform states), falling back to stdlib."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Shared empty fallback so missing-resource paths don't allocate a fresh
+# list per call. A tuple keeps it safely immutable.
+_EMPTY_RESOURCES: tuple = ()
+
+# Maps a resource's type/category to its (section, bucket) slot in the
+# structured architecture. Keeping this as a flat table lets
+# _structure_architecture classify every resource in a single pass instead
+# of re-scanning the resource list once per category.
+_RESOURCE_BUCKETS: Dict[str, tuple] = {
+    # Networking
+    "vpc": ("networking", "vpcs"),
+    "subnet": ("networking", "subnets"),
+    "load_balancer": ("networking", "load_balancers"),
+    "security_group": ("networking", "security_groups"),
+    # Compute
+    "instance": ("compute", "instances"),
+    "container": ("compute", "containers"),
+    "serverless": ("compute", "serverless"),
+    "function": ("compute", "serverless"),
+    # Storage
+    "bucket": ("storage", "buckets"),
+    "database": ("storage", "databases"),
+    "volume": ("storage", "volumes"),
+    # Security
+    "iam_role": ("security", "iam_roles"),
+    "policy": ("security", "policies"),
+    "certificate": ("security", "certificates"),
+}
+
+# Provider-native resource type names, folded into the generic table per
+# provider so discovery output can be classified without renaming types.
+_AWS_RESOURCE_TYPES: Dict[str, tuple] = {
+    "aws_instance": ("compute", "instances"),
+    "aws_ecs_service": ("compute", "containers"),
+    "aws_lambda_function": ("compute", "serverless"),
+    "aws_s3_bucket": ("storage", "buckets"),
+    "aws_db_instance": ("storage", "databases"),
+    "aws_ebs_volume": ("storage", "volumes"),
+    "aws_vpc": ("networking", "vpcs"),
+    "aws_subnet": ("networking", "subnets"),
+    "aws_lb": ("networking", "load_balancers"),
+    "aws_elb": ("networking", "load_balancers"),
+    "aws_security_group": ("networking", "security_groups"),
+    "aws_iam_role": ("security", "iam_roles"),
+    "aws_iam_policy": ("security", "policies"),
+    "aws_acm_certificate": ("security", "certificates"),
+}
+
+_AZURE_RESOURCE_TYPES: Dict[str, tuple] = {
+    "Microsoft.Compute/virtualMachines": ("compute", "instances"),
+    "Microsoft.ContainerInstance/containerGroups": ("compute", "containers"),
+    "Microsoft.Web/sites": ("compute", "serverless"),
+    "Microsoft.Storage/storageAccounts": ("storage", "buckets"),
+    "Microsoft.Sql/servers": ("storage", "databases"),
+    "Microsoft.Compute/disks": ("storage", "volumes"),
+    "Microsoft.Network/virtualNetworks": ("networking", "vpcs"),
+    "Microsoft.Network/loadBalancers": ("networking", "load_balancers"),
+    "Microsoft.Network/networkSecurityGroups": ("networking", "security_groups"),
+    "Microsoft.Authorization/roleDefinitions": ("security", "iam_roles"),
+    "Microsoft.Authorization/policyDefinitions": ("security", "policies"),
+}
+
+
+# (section, bucket) pairs that get a parallel cost column; these are the
+# buckets the cost simulator aggregates over.
+_COST_COLUMN_BUCKETS = (
+    ("compute", "instances"),
+    ("storage", "buckets"),
+    ("networking", "load_balancers"),
+)
+
+
+# Cutoff for storing cost columns as float32: below 2**23 / 100 the
+# float32 spacing is well under a cent, so cent-granular costs
+# round-trip exactly. Columns with any larger value stay float64.
+_FLOAT32_COST_LIMIT = (1 << 23) / 100
+
+
+def _cost_column(items: List[Dict[str, Any]]) -> "np.ndarray":
+    """Extract a resource list's monthly costs into a contiguous array.
+
+    Stored alongside the dicts (SoA layout) so downstream cost sweeps
+    reduce one contiguous array instead of chasing a pointer per dict.
+    Columns whose values all fit float32 with cent precision are stored
+    at half width — half the memory bandwidth and twice the SIMD lanes
+    on the reduction; consumers accumulate in float64 regardless.
+    """
+    arr = np.fromiter(
+        (item.get("monthly_cost", 0) for item in items),
+        dtype=np.float64,
+        count=len(items)
+    )
+    if arr.size and np.abs(arr).max() < _FLOAT32_COST_LIMIT:
+        return arr.astype(np.float32)
+    return arr
+
+
+def _make_structurer(provider_types: Dict[str, tuple]):
+    """
+    Build a structuring routine specialized for one provider.
+
+    The provider is fixed for a whole discovery run, so the generic and
+    provider-specific type tables are merged once here instead of
+    re-branching on the provider for every resource.
+    """
+    dispatch = {**_RESOURCE_BUCKETS, **provider_types}
+
+    def structure(raw_data: Dict[str, Any], cloud_provider: str) -> Dict[str, Any]:
+        resources = raw_data.get("resources") or _EMPTY_RESOURCES
+
+        sections = {
+            "networking": {
+                "vpcs": [],
+                "subnets": [],
+                "load_balancers": [],
+                "security_groups": []
+            },
+            "compute": {
+                "instances": [],
+                "containers": [],
+                "serverless": []
+            },
+            "storage": {
+                "buckets": [],
+                "databases": [],
+                "volumes": []
+            },
+            "security": {
+                "iam_roles": [],
+                "policies": [],
+                "certificates": []
+            }
+        }
+
+        # Single pass over the resource list: classify each resource into
+        # its section bucket and collect services at the same time, instead
+        # of iterating once per category.
+        services = set()
+        for resource in resources:
+            if "service" in resource:
+                services.add(resource["service"])
+
+            slot = dispatch.get(
+                resource.get("type") or resource.get("category")
+            )
+            if slot:
+                section, bucket = slot
+                sections[section][bucket].append(resource)
+
+        # Parallel cost columns for the buckets the cost simulator sums
+        # over, so its aggregations become single array reductions
+        for section, bucket in _COST_COLUMN_BUCKETS:
+            sections[section]["_monthly_cost_arr"] = _cost_column(
+                sections[section][bucket]
+            )
+
+        return {
+            "provider": cloud_provider,
+            "resources": resources,
+            "services": sorted(services),
+            "networking": sections["networking"],
+            "compute": sections["compute"],
+            "storage": sections["storage"],
+            "security": sections["security"],
+            "metadata": {
+                "total_resources": len(resources),
+                "extraction_method": raw_data.get("source", "unknown")
+            }
+        }
+
+    return structure
+
+
+# One specialized structurer per provider, built at import time; unknown
+# providers fall back to the generic type table only.
+_STRUCTURERS = {
+    "aws": _make_structurer(_AWS_RESOURCE_TYPES),
+    "azure": _make_structurer(_AZURE_RESOURCE_TYPES),
+}
+_GENERIC_STRUCTURER = _make_structurer({})
 
 
 class ArchitectureReaderAgent(BaseAgent):
@@ -36,6 +237,18 @@ class ArchitectureReaderAgent(BaseAgent):
             description="Reads and understands cloud architecture from multiple sources"
         )
         self._cloud_clients = {}  # Will store AWS/Azure clients
+        # TTL cache for API discovery results, keyed by
+        # (cloud_provider, region, credentials hash). Entries past their TTL
+        # are kept around as a stale fallback for when the provider API fails.
+        self._api_cache: Dict[tuple, tuple] = {}  # key -> (timestamp, data)
+        self._api_cache_ttl = 30.0  # seconds
+        self._api_cache_maxsize = 64
+        # Optional executor for CPU-bound parsing. None means
+        # asyncio.to_thread; inject a ProcessPoolExecutor for huge states
+        # where the GIL would serialize the thread-based path.
+        self._executor = None
+        # Content-addressed cache for LLM documentation extraction
+        self._llm_cache = LLMResponseCache()
     
     def get_required_inputs(self) -> List[str]:
         """
@@ -101,9 +314,10 @@ class ArchitectureReaderAgent(BaseAgent):
                     error=f"Unsupported source_type: {source_type}"
                 )
             
-            # Structure the architecture data
-            structured_architecture = self._structure_architecture(
-                architecture_data, cloud_provider
+            # Structure the architecture data (CPU-bound on large
+            # inventories, so keep it off the event loop)
+            structured_architecture = await self._run_parse(
+                self._structure_architecture, architecture_data, cloud_provider
             )
             
             self.set_status(AgentStatus.COMPLETED)
@@ -131,58 +345,240 @@ class ArchitectureReaderAgent(BaseAgent):
                 error=f"Error reading architecture: {str(e)}"
             )
     
+    def _api_cache_key(
+        self, cloud_provider: str, credentials: Dict[str, Any], region: str = None
+    ) -> tuple:
+        """Build the discovery cache key, hashing credentials so they are
+        never stored in the cache itself."""
+        credentials_hash = hashlib.sha256(
+            json.dumps(credentials, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return (cloud_provider, region, credentials_hash)
+
     async def _read_from_api(
         self, cloud_provider: str, credentials: Dict[str, Any], region: str = None
     ) -> Dict[str, Any]:
         """
         Read architecture by querying cloud provider APIs.
-        
+
+        Results are cached per (provider, region, credentials) for a short
+        TTL so repeated analysis runs on the same account don't re-issue
+        rate-limited discovery calls. If the provider API fails, the last
+        cached value (even if stale) is returned instead of erroring out.
+
         Args:
             cloud_provider: "aws" or "azure"
             credentials: Authentication credentials
             region: Optional region filter
-            
+
+        Returns:
+            Raw architecture data from API
+        """
+        key = self._api_cache_key(cloud_provider, credentials, region)
+        cached = self._api_cache.get(key)
+        now = time.monotonic()
+
+        if cached and now - cached[0] < self._api_cache_ttl:
+            return cached[1]
+
+        try:
+            data = await self._discover_from_api(cloud_provider, credentials, region)
+        except Exception:
+            if cached:
+                # Stale fallback: a stale discovery beats a failed one
+                return cached[1]
+            raise
+
+        if len(self._api_cache) >= self._api_cache_maxsize and key not in self._api_cache:
+            # Evict the oldest entry to bound cache size
+            oldest = min(self._api_cache, key=lambda k: self._api_cache[k][0])
+            del self._api_cache[oldest]
+        self._api_cache[key] = (now, data)
+
+        return data
+
+    async def _discover_from_api(
+        self, cloud_provider: str, credentials: Dict[str, Any], region: str = None
+    ) -> Dict[str, Any]:
+        """
+        Perform the actual (uncached) cloud provider API discovery.
+
+        Args:
+            cloud_provider: "aws" or "azure"
+            credentials: Authentication credentials
+            region: Optional region filter
+
         Returns:
             Raw architecture data from API
         """
         # TODO: Implement actual API calls
         # This will use boto3 for AWS or Azure SDK for Azure
-        
+
         if cloud_provider == "aws":
-            # Placeholder for AWS API discovery
+            queries = self._build_discovery_queries("aws", region)
+            responses = await self._batch_query(cloud_provider, queries)
             return {
                 "provider": "aws",
-                "resources": [],
+                "resources": [r for response in responses for r in response.get("resources", [])],
                 "message": "AWS API discovery not yet implemented"
             }
         elif cloud_provider == "azure":
-            # Placeholder for Azure API discovery
+            queries = self._build_discovery_queries("azure", region)
+            responses = await self._batch_query(cloud_provider, queries)
             return {
                 "provider": "azure",
-                "resources": [],
+                "resources": [r for response in responses for r in response.get("resources", [])],
                 "message": "Azure API discovery not yet implemented"
             }
         else:
             raise ValueError(f"Unsupported cloud provider: {cloud_provider}")
+
+    def _build_discovery_queries(self, cloud_provider: str, region: str = None) -> List[Dict[str, Any]]:
+        """
+        Build the per-resource-type discovery queries for one provider.
+
+        Keeping these as data (rather than issuing a call per resource type
+        inline) lets _batch_query flush them in a single round-trip.
+        """
+        if cloud_provider == "aws":
+            services = ["ec2", "s3", "elb", "rds", "iam"]
+        else:
+            services = ["compute", "storage", "network", "authorization"]
+        return [{"service": service, "region": region} for service in services]
+
+    async def _batch_query(
+        self, cloud_provider: str, queries: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a group of discovery queries as one batched request.
+
+        Rather than one HTTP round-trip per resource type, all queries are
+        collected and flushed together: Azure via the ARM batch endpoint
+        (POST /batch with a list of relative URLs), AWS via paginated
+        Describe* calls that accept many IDs per request. Queries that
+        can't be folded into one provider batch run concurrently under a
+        single gather, so wall time tracks the slowest service, not the
+        sum. The real implementation must use non-blocking clients
+        (aioboto3 for AWS, aiohttp for the Azure REST calls) — a
+        synchronous boto3 call inside these coroutines would stall the
+        event loop and serialize the whole gather.
+
+        Args:
+            cloud_provider: "aws" or "azure"
+            queries: Query descriptors from _build_discovery_queries
+
+        Returns:
+            One response dict per query, in query order
+        """
+        responses = await asyncio.gather(
+            *(self._execute_query_with_retry(cloud_provider, query) for query in queries)
+        )
+        return list(responses)
+
+    async def _execute_query_with_retry(
+        self,
+        cloud_provider: str,
+        query: Dict[str, Any],
+        max_attempts: int = 4,
+        base_delay: float = 0.5
+    ) -> Dict[str, Any]:
+        """
+        Execute one discovery query with exponential-backoff retries.
+
+        Cloud discovery APIs throttle aggressively; backing off instead of
+        hammering keeps a wide concurrent gather from tripping rate limits.
+
+        Args:
+            cloud_provider: "aws" or "azure"
+            query: Query descriptor to execute
+            max_attempts: Total attempts before giving up
+            base_delay: Initial backoff in seconds, doubled per attempt
+
+        Returns:
+            The query response
+        """
+        for attempt in range(max_attempts):
+            try:
+                return await self._execute_query(cloud_provider, query)
+            except Exception:
+                if attempt == max_attempts - 1:
+                    raise
+                await asyncio.sleep(base_delay * (2 ** attempt))
+
+    async def _execute_query(
+        self, cloud_provider: str, query: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Execute a single discovery query (uncached, no retry).
+
+        Args:
+            cloud_provider: "aws" or "azure"
+            query: Query descriptor to execute
+
+        Returns:
+            The query response
+        """
+        # TODO: Implement the real calls with async-native clients:
+        # - AWS: async with aioboto3.Session().client(service, region_name=...)
+        #   and await client.describe_*() / get_paginator(...)
+        # - Azure: aiohttp.ClientSession POST of
+        #   {"requests": [{"httpMethod": "GET", "relativeUrl": u}, ...]}
+        #   to https://management.azure.com/batch?api-version=2017-03-01
+
+        return {"query": query, "resources": []}
     
+    def set_executor(self, executor: Any) -> None:
+        """Set an executor (e.g. ProcessPoolExecutor) for CPU-bound parsing"""
+        self._executor = executor
+
+    async def _run_parse(self, func, *args) -> Any:
+        """
+        Run a CPU-bound parsing function without blocking the event loop.
+
+        Parsing a multi-hundred-MB state file on the loop would stall every
+        other coroutine (including concurrent agent runs); offload to a
+        worker thread, or to the injected executor when one is set.
+        """
+        if self._executor is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        return await asyncio.to_thread(func, *args)
+
     async def _read_from_terraform(self, terraform_path: str) -> Dict[str, Any]:
         """
-        Read architecture from Terraform state file or configuration.
-        
+        Read architecture from a Terraform state file.
+
+        The file read and JSON parse run off the event loop via _run_parse.
+
         Args:
-            terraform_path: Path to terraform.tfstate or terraform directory
-            
+            terraform_path: Path to terraform.tfstate (optionally gzipped)
+
         Returns:
             Architecture data extracted from Terraform
         """
-        # TODO: Implement Terraform state parsing
-        # This will parse .tfstate JSON files or analyze .tf files
-        
+        return await self._run_parse(self._parse_terraform_sync, terraform_path)
+
+    def _parse_terraform_sync(self, terraform_path: str) -> Dict[str, Any]:
+        """
+        Parse a Terraform state file (synchronous, CPU-bound).
+
+        Large states are notoriously slow to parse; the whole file is read
+        as bytes and handed to orjson when installed. Gzipped state files
+        (.tfstate.gz or gzip magic bytes) are decompressed transparently.
+        """
+        with open(terraform_path, "rb") as f:
+            raw = f.read()
+
+        if raw[:2] == b"\x1f\x8b":  # gzip magic bytes
+            raw = gzip.decompress(raw)
+
+        state = _loads_json(raw)
+
         return {
             "source": "terraform",
             "path": terraform_path,
-            "resources": [],
-            "message": "Terraform parsing not yet implemented"
+            "terraform_version": state.get("terraform_version"),
+            "resources": state.get("resources") or []
         }
     
     async def _read_from_cloudformation(
@@ -210,19 +606,59 @@ class ArchitectureReaderAgent(BaseAgent):
     async def _read_from_documentation(self, doc_path: str) -> Dict[str, Any]:
         """
         Read architecture from documentation using LLM.
-        
+
+        Responses are cached by a hash of the document contents, so
+        re-reading unchanged documentation skips the LLM round-trip
+        entirely; if the LLM call fails, a stale cached extraction is
+        returned rather than failing the read.
+
         Args:
             doc_path: Path to documentation file or URL
-            
+
         Returns:
             Architecture data extracted from documentation
         """
-        # This will use LLM to understand architecture from text/diagrams
-        # TODO: Implement LLM-based architecture extraction
-        
         if not self._llm_client:
             raise ValueError("LLM client not configured for documentation reading")
-        
+
+        try:
+            with open(doc_path, "rb") as f:
+                content = f.read()
+        except OSError:
+            content = doc_path.encode()  # URL or other non-file source
+
+        key = LLMResponseCache.make_key(content)
+        cached = self._llm_cache.get(key)
+        if cached and cached[0]:
+            return cached[1]
+
+        try:
+            extracted = await self._llm_extract_architecture(doc_path, content)
+        except Exception:
+            if cached:
+                # Stale fallback: an old extraction beats a failed one
+                return cached[1]
+            raise
+
+        self._llm_cache.set(key, extracted)
+        return extracted
+
+    async def _llm_extract_architecture(
+        self, doc_path: str, content: bytes
+    ) -> Dict[str, Any]:
+        """
+        Extract architecture from documentation via the LLM (uncached).
+
+        Args:
+            doc_path: Path to documentation file or URL
+            content: Raw document bytes
+
+        Returns:
+            Architecture data extracted from documentation
+        """
+        # This will use LLM to understand architecture from text/diagrams
+        # TODO: Implement LLM-based architecture extraction
+
         # Placeholder for LLM-based extraction
         return {
             "source": "documentation",
@@ -236,74 +672,18 @@ class ArchitectureReaderAgent(BaseAgent):
     ) -> Dict[str, Any]:
         """
         Structure the raw architecture data into a standardized format.
-        
+
+        Dispatches to a structurer precompiled for the provider, so
+        provider-specific resource type names resolve through a single
+        merged table with no per-resource provider branching.
+
         Args:
             raw_data: Raw architecture data
             cloud_provider: Cloud provider name
-            
+
         Returns:
             Structured architecture dictionary
         """
-        # Standardize the architecture representation
-        structured = {
-            "provider": cloud_provider,
-            "resources": raw_data.get("resources", []),
-            "services": self._extract_services(raw_data.get("resources", [])),
-            "networking": self._extract_networking(raw_data.get("resources", [])),
-            "compute": self._extract_compute(raw_data.get("resources", [])),
-            "storage": self._extract_storage(raw_data.get("resources", [])),
-            "security": self._extract_security(raw_data.get("resources", [])),
-            "metadata": {
-                "total_resources": len(raw_data.get("resources", [])),
-                "extraction_method": raw_data.get("source", "unknown")
-            }
-        }
-        
-        return structured
-    
-    def _extract_services(self, resources: List[Dict[str, Any]]) -> List[str]:
-        """Extract list of cloud services used"""
-        # TODO: Implement service extraction logic
-        services = set()
-        for resource in resources:
-            if "service" in resource:
-                services.add(resource["service"])
-        return sorted(list(services))
-    
-    def _extract_networking(self, resources: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract networking-related resources"""
-        # TODO: Implement networking extraction
-        return {
-            "vpcs": [],
-            "subnets": [],
-            "load_balancers": [],
-            "security_groups": []
-        }
-    
-    def _extract_compute(self, resources: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract compute-related resources"""
-        # TODO: Implement compute extraction
-        return {
-            "instances": [],
-            "containers": [],
-            "serverless": []
-        }
-    
-    def _extract_storage(self, resources: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract storage-related resources"""
-        # TODO: Implement storage extraction
-        return {
-            "buckets": [],
-            "databases": [],
-            "volumes": []
-        }
-    
-    def _extract_security(self, resources: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Extract security-related resources"""
-        # TODO: Implement security extraction
-        return {
-            "iam_roles": [],
-            "policies": [],
-            "certificates": []
-        }
+        structurer = _STRUCTURERS.get(cloud_provider, _GENERIC_STRUCTURER)
+        return structurer(raw_data, cloud_provider)
 
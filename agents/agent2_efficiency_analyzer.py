@@ -14,11 +14,131 @@ Areas of analysis:
 """
 
 from typing import Dict, Any, List, Optional
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 from agents.base_agent import BaseAgent, AgentResult, AgentStatus
+from agents.llm_cache import LLMResponseCache
+from agents._analyzer_kernels import compute_masks, storage_masks
+import asyncio
+import numpy as np
 import yaml
 import os
 
 
+# Sort order for finding severities (critical first). Module-level so the
+# lookup table isn't rebuilt on every prioritization call.
+SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Instance size suffixes considered "big" for the over-provisioning check.
+# Matching the parsed size suffix against this set is an O(1) hash lookup
+# (vs. substring scans, which also false-positive "large" inside "xlarge").
+_BIG_INSTANCE_SIZES = frozenset({
+    "large", "xlarge", "2xlarge", "4xlarge", "8xlarge",
+    "12xlarge", "16xlarge", "24xlarge", "metal"
+})
+
+@lru_cache(maxsize=8)
+def _expand_size_patterns(patterns: tuple) -> frozenset:
+    """Expand configured size patterns into the exact suffixes they match.
+
+    instance_types_to_check entries historically matched as substrings of
+    the instance type, so a configured "large" also covered "8xlarge".
+    The over-provisioning check now keys on the exact size suffix; to
+    keep shipped configs meaning what they did, each pattern is expanded
+    against the known tier list (verbatim entries are kept too, for
+    custom sizes outside it).
+    """
+    return frozenset(patterns) | frozenset(
+        size for size in _BIG_INSTANCE_SIZES
+        if any(pattern in size for pattern in patterns)
+    )
+
+
+# Shared read-only fallback for instances without utilization data, so
+# the compute loop doesn't allocate a throwaway dict per such instance.
+_NO_UTILIZATION: Dict[str, Any] = {}
+
+# Finding counts below this stay on the plain-Python aggregation path;
+# above it, NumPy's C-level reductions win despite the array build cost.
+_VECTORIZE_MIN_FINDINGS = 1024
+
+# Resource counts below this take the plain per-dict loop in the
+# _analyze_* checks; above it, the threshold predicates run as array
+# kernels over SoA columns (see agents._analyzer_kernels).
+_VECTORIZE_MIN_RESOURCES = 1024
+
+
+@dataclass(slots=True)
+class Finding:
+    """A single inefficiency finding.
+
+    Slotted record instead of a dict: roughly half the memory per finding
+    and faster field access, which matters when audits produce thousands
+    of findings. Dict-style access (``f["type"]``, ``f.get(...)``) is kept
+    so aggregation helpers can accept either form; ``to_dict`` converts at
+    the API boundary in ``process``.
+    """
+    type: str
+    resource_id: Optional[str]
+    severity: str
+    description: str
+    recommendation: str
+    potential_savings: float
+    category: str
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type,
+            "resource_id": self.resource_id,
+            "severity": self.severity,
+            "description": self.description,
+            "recommendation": self.recommendation,
+            "potential_savings": self.potential_savings,
+            "category": self.category
+        }
+
+
+@dataclass(slots=True)
+class _FindingColumns:
+    """SoA key columns extracted from a finding list.
+
+    Built once per analysis and shared by prioritization and savings
+    estimation, so a large finding list is scanned a single time instead
+    of once per aggregate.
+    """
+    ranks: np.ndarray       # int8 severity ranks
+    savings: np.ndarray     # float64 potential savings
+    category_unique: np.ndarray
+    category_inverse: np.ndarray
+
+
+def _finding_columns(findings: List[Dict[str, Any]]) -> _FindingColumns:
+    """Extract the numeric key columns from findings in one pass"""
+    count = len(findings)
+    ranks = np.fromiter(
+        (SEVERITY_RANK.get(f.get("severity", "low"), 3) for f in findings),
+        dtype=np.int8, count=count
+    )
+    savings = np.fromiter(
+        (f.get("potential_savings", 0) or 0 for f in findings),
+        dtype=np.float64, count=count
+    )
+    unique, inverse = np.unique(
+        [f.get("category", "other") for f in findings], return_inverse=True
+    )
+    return _FindingColumns(ranks, savings, unique, inverse)
+
+
 class EfficiencyAnalyzerAgent(BaseAgent):
     """
     Agent responsible for finding inefficiencies in cloud architecture.
@@ -45,6 +165,8 @@ class EfficiencyAnalyzerAgent(BaseAgent):
             description="Identifies inefficiencies and optimization opportunities in cloud architecture"
         )
         self.config = self._load_config(config_path)
+        # Content-addressed cache for LLM pattern analysis
+        self._llm_cache = LLMResponseCache()
     
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
         """Load configuration from file or use defaults"""
@@ -120,24 +242,43 @@ class EfficiencyAnalyzerAgent(BaseAgent):
                 architecture, analysis_depth, focus_areas
             )
             
+            # For large finding lists, extract the numeric key columns
+            # once and share them between prioritization and savings
+            # estimation instead of re-scanning the findings per step
+            columns = (
+                _finding_columns(inefficiencies)
+                if len(inefficiencies) >= _VECTORIZE_MIN_FINDINGS
+                else None
+            )
+
             # Prioritize findings
-            prioritized = self._prioritize_inefficiencies(inefficiencies)
-            
+            prioritized = self._prioritize_inefficiencies(inefficiencies, columns)
+
             # Calculate potential savings
-            savings_estimate = self._estimate_savings(inefficiencies)
-            
+            savings_estimate = self._estimate_savings(inefficiencies, columns)
+
+            # Count severities in one pass instead of one scan per level
+            severity_counts = Counter(
+                i.get("severity", "low") for i in inefficiencies
+            )
+
             self.set_status(AgentStatus.COMPLETED)
-            
+
             return AgentResult(
                 success=True,
                 data={
-                    "inefficiencies": prioritized,
+                    # Findings live as slotted records internally; convert to
+                    # plain dicts only here, at the API boundary.
+                    "inefficiencies": [
+                        f.to_dict() if isinstance(f, Finding) else f
+                        for f in prioritized
+                    ],
                     "summary": {
                         "total_findings": len(inefficiencies),
-                        "critical_count": len([i for i in inefficiencies if i.get("severity") == "critical"]),
-                        "high_count": len([i for i in inefficiencies if i.get("severity") == "high"]),
-                        "medium_count": len([i for i in inefficiencies if i.get("severity") == "medium"]),
-                        "low_count": len([i for i in inefficiencies if i.get("severity") == "low"]),
+                        "critical_count": severity_counts["critical"],
+                        "high_count": severity_counts["high"],
+                        "medium_count": severity_counts["medium"],
+                        "low_count": severity_counts["low"],
                         "estimated_savings": savings_estimate
                     },
                     "recommendations": self._generate_recommendations(inefficiencies),
@@ -173,33 +314,42 @@ class EfficiencyAnalyzerAgent(BaseAgent):
         Returns:
             List of inefficiency findings
         """
-        inefficiencies = []
-        
-        # Analyze compute resources
-        if not focus_areas or "compute" in focus_areas:
-            compute_issues = await self._analyze_compute(architecture.get("compute", {}))
-            inefficiencies.extend(compute_issues)
-        
-        # Analyze storage resources
-        if not focus_areas or "storage" in focus_areas:
-            storage_issues = await self._analyze_storage(architecture.get("storage", {}))
-            inefficiencies.extend(storage_issues)
-        
-        # Analyze networking
-        if not focus_areas or "networking" in focus_areas:
-            networking_issues = await self._analyze_networking(architecture.get("networking", {}))
-            inefficiencies.extend(networking_issues)
-        
-        # Analyze security
-        if not focus_areas or "security" in focus_areas:
-            security_issues = await self._analyze_security(architecture.get("security", {}))
-            inefficiencies.extend(security_issues)
-        
+        # Frozenset membership instead of scanning the focus_areas list once
+        # per category; None means "analyze everything".
+        focus = frozenset(focus_areas) if focus_areas else None
+
+        # The per-category analyzers are independent, so run them concurrently
+        # instead of awaiting each in turn. Task order mirrors the previous
+        # serial sequence so finding order stays deterministic.
+        tasks = []
+
+        # Only schedule compute/storage/networking analyzers when their
+        # section actually has resources — sparsely populated accounts then
+        # skip the task-scheduling overhead entirely. Security is always
+        # scheduled: its job includes flagging the *absence* of IAM config.
+        compute = architecture.get("compute", {})
+        if (focus is None or "compute" in focus) and compute.get("instances"):
+            tasks.append(self._analyze_compute(compute))
+
+        storage = architecture.get("storage", {})
+        if (focus is None or "storage" in focus) and storage.get("buckets"):
+            tasks.append(self._analyze_storage(storage))
+
+        networking = architecture.get("networking", {})
+        if (focus is None or "networking" in focus) and networking.get("load_balancers"):
+            tasks.append(self._analyze_networking(networking))
+
+        if focus is None or "security" in focus:
+            tasks.append(self._analyze_security(architecture.get("security", {})))
+
         # Use LLM for advanced pattern detection if available
         if self._llm_client and depth in ["detailed", "comprehensive"]:
-            llm_findings = await self._llm_analyze_patterns(architecture, depth)
-            inefficiencies.extend(llm_findings)
-        
+            tasks.append(self._llm_analyze_patterns(architecture, depth))
+
+        inefficiencies = []
+        for findings in await asyncio.gather(*tasks):
+            inefficiencies.extend(findings)
+
         return inefficiencies
     
     async def _analyze_compute(self, compute_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -211,44 +361,108 @@ class EfficiencyAnalyzerAgent(BaseAgent):
         memory_threshold = thresholds.get("underutilized_memory_percent", 20)
         over_prov_threshold = thresholds.get("over_provisioned_cpu_percent", 30)
         
+        savings_percentages = self.config.get("cost_estimation", {}).get("savings_percentage", {})
+        underutilized_pct = savings_percentages.get("underutilized_instance", 0.5)
+        over_provisioned_pct = savings_percentages.get("over_provisioned", 0.3)
+        configured_sizes = thresholds.get("instance_types_to_check")
+        big_sizes = (
+            _expand_size_patterns(tuple(configured_sizes))
+            if configured_sizes else _BIG_INSTANCE_SIZES
+        )
+
         instances = compute_data.get("instances", [])
-        
-        # Check for underutilized instances
+
+        # Large fleets: evaluate the threshold predicates as array kernels
+        # over SoA columns and only materialize findings for flagged rows.
+        if len(instances) >= _VECTORIZE_MIN_RESOURCES:
+            count = len(instances)
+            cpu = np.fromiter(
+                ((i.get("utilization") or _NO_UTILIZATION).get("cpu", 0) for i in instances),
+                dtype=np.float64, count=count
+            )
+            memory = np.fromiter(
+                ((i.get("utilization") or _NO_UTILIZATION).get("memory", 0) for i in instances),
+                dtype=np.float64, count=count
+            )
+            is_big = np.fromiter(
+                (
+                    i.get("instance_type", "").rsplit(".", 1)[-1].lower() in big_sizes
+                    for i in instances
+                ),
+                dtype=np.bool_, count=count
+            )
+
+            underutilized, over_provisioned = compute_masks(
+                cpu, memory, is_big,
+                float(cpu_threshold), float(memory_threshold), float(over_prov_threshold)
+            )
+
+            # Same per-instance finding order as the scalar loop below
+            for index in np.nonzero(underutilized | over_provisioned)[0]:
+                instance = instances[index]
+                instance_id = instance.get("id")
+                monthly_cost = instance.get("monthly_cost", 0)
+                if underutilized[index]:
+                    # Format from the dict's own values so descriptions
+                    # are byte-identical to the scalar path's
+                    utilization = instance.get("utilization") or _NO_UTILIZATION
+                    cpu_util = utilization.get("cpu", 0)
+                    memory_util = utilization.get("memory", 0)
+                    findings.append(Finding(
+                        type="underutilized_instance",
+                        resource_id=instance_id,
+                        severity="high",
+                        description=f"Instance {instance_id} is underutilized (CPU: {cpu_util}%, Memory: {memory_util}%)",
+                        recommendation="Consider right-sizing or consolidating instances",
+                        potential_savings=monthly_cost * underutilized_pct,
+                        category="compute"
+                    ))
+                if over_provisioned[index]:
+                    findings.append(Finding(
+                        type="over_provisioned",
+                        resource_id=instance_id,
+                        severity="medium",
+                        description=f"Instance {instance_id} may be over-provisioned",
+                        recommendation="Consider downsizing to a smaller instance type",
+                        potential_savings=monthly_cost * over_provisioned_pct,
+                        category="compute"
+                    ))
+            return findings
+
+        # Single pass: evaluate both the underutilized and over-provisioned
+        # checks per instance instead of walking the list twice.
         for instance in instances:
-            utilization = instance.get("utilization", {})
+            instance_id = instance.get("id")
+            monthly_cost = instance.get("monthly_cost", 0)
+            utilization = instance.get("utilization") or _NO_UTILIZATION
             cpu_util = utilization.get("cpu", 0)
             memory_util = utilization.get("memory", 0)
-            
+
             if cpu_util < cpu_threshold and memory_util < memory_threshold:
-                savings_pct = self.config.get("cost_estimation", {}).get("savings_percentage", {}).get("underutilized_instance", 0.5)
-                findings.append({
-                    "type": "underutilized_instance",
-                    "resource_id": instance.get("id"),
-                    "severity": "high",
-                    "description": f"Instance {instance.get('id')} is underutilized (CPU: {cpu_util}%, Memory: {memory_util}%)",
-                    "recommendation": "Consider right-sizing or consolidating instances",
-                    "potential_savings": instance.get("monthly_cost", 0) * savings_pct,
-                    "category": "compute"
-                })
-        
-        # Check for over-provisioned instances
-        instance_types_to_check = thresholds.get("instance_types_to_check", ["large", "xlarge"])
-        for instance in instances:
-            instance_type = instance.get("instance_type", "").lower()
-            if any(size in instance_type for size in instance_types_to_check):
-                utilization = instance.get("utilization", {})
-                if utilization.get("cpu", 0) < over_prov_threshold:
-                    savings_pct = self.config.get("cost_estimation", {}).get("savings_percentage", {}).get("over_provisioned", 0.3)
-                    findings.append({
-                        "type": "over_provisioned",
-                        "resource_id": instance.get("id"),
-                        "severity": "medium",
-                        "description": f"Instance {instance.get('id')} may be over-provisioned",
-                        "recommendation": "Consider downsizing to a smaller instance type",
-                        "potential_savings": instance.get("monthly_cost", 0) * savings_pct,
-                        "category": "compute"
-                    })
-        
+                findings.append(Finding(
+                    type="underutilized_instance",
+                    resource_id=instance_id,
+                    severity="high",
+                    description=f"Instance {instance_id} is underutilized (CPU: {cpu_util}%, Memory: {memory_util}%)",
+                    recommendation="Consider right-sizing or consolidating instances",
+                    potential_savings=monthly_cost * underutilized_pct,
+                    category="compute"
+                ))
+
+            # Size suffix of the instance type, e.g. "t2.large" -> "large"
+            size = instance.get("instance_type", "").rsplit(".", 1)[-1].lower()
+            if size in big_sizes:
+                if cpu_util < over_prov_threshold:
+                    findings.append(Finding(
+                        type="over_provisioned",
+                        resource_id=instance_id,
+                        severity="medium",
+                        description=f"Instance {instance_id} may be over-provisioned",
+                        recommendation="Consider downsizing to a smaller instance type",
+                        potential_savings=monthly_cost * over_provisioned_pct,
+                        category="compute"
+                    ))
+
         return findings
     
     async def _analyze_storage(self, storage_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -259,7 +473,51 @@ class EfficiencyAnalyzerAgent(BaseAgent):
         unused_days = thresholds.get("unused_bucket_days", 90)
         
         buckets = storage_data.get("buckets", [])
-        
+
+        # Large bucket inventories: run both checks as array kernels over
+        # SoA columns and only materialize findings for flagged rows.
+        if len(buckets) >= _VECTORIZE_MIN_RESOURCES:
+            savings_percentages = self.config.get("cost_estimation", {}).get("savings_percentage", {})
+            empty_pct = savings_percentages.get("empty_bucket", 1.0)
+            unused_pct = savings_percentages.get("unused_storage", 0.7)
+
+            count = len(buckets)
+            size_gb = np.fromiter(
+                (b.get("size_gb", 0) for b in buckets), dtype=np.float64, count=count
+            )
+            last_accessed = np.fromiter(
+                (b.get("last_accessed_days_ago", 999) for b in buckets),
+                dtype=np.float64, count=count
+            )
+
+            empty, unused = storage_masks(size_gb, last_accessed, float(unused_days))
+
+            for index in np.nonzero(empty | unused)[0]:
+                bucket = buckets[index]
+                bucket_id = bucket.get("id")
+                monthly_cost = bucket.get("monthly_cost", 0)
+                if empty[index]:
+                    findings.append(Finding(
+                        type="empty_bucket",
+                        resource_id=bucket_id,
+                        severity="low",
+                        description=f"Storage bucket {bucket_id} is empty",
+                        recommendation="Consider deleting if not needed",
+                        potential_savings=monthly_cost * empty_pct,
+                        category="storage"
+                    ))
+                else:
+                    findings.append(Finding(
+                        type="unused_storage",
+                        resource_id=bucket_id,
+                        severity="medium",
+                        description=f"Storage bucket {bucket_id} hasn't been accessed in {bucket.get('last_accessed_days_ago', 999)} days",
+                        recommendation="Consider moving to cheaper storage tier or archiving",
+                        potential_savings=monthly_cost * unused_pct,
+                        category="storage"
+                    ))
+            return findings
+
         # Check for unused or empty buckets
         for bucket in buckets:
             size = bucket.get("size_gb", 0)
@@ -267,26 +525,26 @@ class EfficiencyAnalyzerAgent(BaseAgent):
             
             if size == 0:
                 savings_pct = self.config.get("cost_estimation", {}).get("savings_percentage", {}).get("empty_bucket", 1.0)
-                findings.append({
-                    "type": "empty_bucket",
-                    "resource_id": bucket.get("id"),
-                    "severity": "low",
-                    "description": f"Storage bucket {bucket.get('id')} is empty",
-                    "recommendation": "Consider deleting if not needed",
-                    "potential_savings": bucket.get("monthly_cost", 0) * savings_pct,
-                    "category": "storage"
-                })
+                findings.append(Finding(
+                    type="empty_bucket",
+                    resource_id=bucket.get("id"),
+                    severity="low",
+                    description=f"Storage bucket {bucket.get('id')} is empty",
+                    recommendation="Consider deleting if not needed",
+                    potential_savings=bucket.get("monthly_cost", 0) * savings_pct,
+                    category="storage"
+                ))
             elif last_accessed > unused_days:
                 savings_pct = self.config.get("cost_estimation", {}).get("savings_percentage", {}).get("unused_storage", 0.7)
-                findings.append({
-                    "type": "unused_storage",
-                    "resource_id": bucket.get("id"),
-                    "severity": "medium",
-                    "description": f"Storage bucket {bucket.get('id')} hasn't been accessed in {last_accessed} days",
-                    "recommendation": "Consider moving to cheaper storage tier or archiving",
-                    "potential_savings": bucket.get("monthly_cost", 0) * savings_pct,
-                    "category": "storage"
-                })
+                findings.append(Finding(
+                    type="unused_storage",
+                    resource_id=bucket.get("id"),
+                    severity="medium",
+                    description=f"Storage bucket {bucket.get('id')} hasn't been accessed in {last_accessed} days",
+                    recommendation="Consider moving to cheaper storage tier or archiving",
+                    potential_savings=bucket.get("monthly_cost", 0) * savings_pct,
+                    category="storage"
+                ))
         
         return findings
     
@@ -304,15 +562,15 @@ class EfficiencyAnalyzerAgent(BaseAgent):
             active_connections = lb.get("active_connections", 0)
             if active_connections <= idle_threshold:
                 savings_pct = self.config.get("cost_estimation", {}).get("savings_percentage", {}).get("idle_load_balancer", 1.0)
-                findings.append({
-                    "type": "idle_load_balancer",
-                    "resource_id": lb.get("id"),
-                    "severity": "high",
-                    "description": f"Load balancer {lb.get('id')} has no active connections",
-                    "recommendation": "Consider removing if not in use",
-                    "potential_savings": lb.get("monthly_cost", 0) * savings_pct,
-                    "category": "networking"
-                })
+                findings.append(Finding(
+                    type="idle_load_balancer",
+                    resource_id=lb.get("id"),
+                    severity="high",
+                    description=f"Load balancer {lb.get('id')} has no active connections",
+                    recommendation="Consider removing if not in use",
+                    potential_savings=lb.get("monthly_cost", 0) * savings_pct,
+                    category="networking"
+                ))
         
         return findings
     
@@ -324,16 +582,16 @@ class EfficiencyAnalyzerAgent(BaseAgent):
         iam_roles = security_data.get("iam_roles", [])
         policies = security_data.get("policies", [])
         
-        if len(iam_roles) == 0:
-            findings.append({
-                "type": "missing_iam",
-                "resource_id": "global",
-                "severity": "critical",
-                "description": "No IAM roles detected - potential security risk",
-                "recommendation": "Implement proper IAM roles and policies",
-                "potential_savings": 0,  # Security improvement, not cost savings
-                "category": "security"
-            })
+        if not iam_roles:
+            findings.append(Finding(
+                type="missing_iam",
+                resource_id="global",
+                severity="critical",
+                description="No IAM roles detected - potential security risk",
+                recommendation="Implement proper IAM roles and policies",
+                potential_savings=0,  # Security improvement, not cost savings
+                category="security"
+            ))
         
         return findings
     
@@ -342,65 +600,138 @@ class EfficiencyAnalyzerAgent(BaseAgent):
     ) -> List[Dict[str, Any]]:
         """
         Use LLM to analyze patterns and find advanced inefficiencies.
-        
+
+        Responses are cached by a hash of (architecture, model, depth), so
+        re-analyzing an unchanged architecture skips the LLM round-trip;
+        on an LLM failure a stale cached result is used instead of
+        dropping the pattern findings.
+
         Args:
             architecture: Full architecture data
             depth: Analysis depth
-            
+
         Returns:
             List of LLM-discovered inefficiencies
         """
         if not self._llm_client:
             return []
-        
+
+        model_id = self.config.get("llm_analysis", {}).get("model", "")
+        key = LLMResponseCache.make_key(architecture, model_id, depth)
+        cached = self._llm_cache.get(key)
+        if cached and cached[0]:
+            return cached[1]
+
+        try:
+            findings = await self._llm_detect_patterns(architecture, depth)
+        except Exception:
+            if cached:
+                return cached[1]
+            raise
+
+        self._llm_cache.set(key, findings)
+        return findings
+
+    async def _llm_detect_patterns(
+        self, architecture: Dict[str, Any], depth: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the actual (uncached) LLM pattern analysis.
+
+        Args:
+            architecture: Full architecture data
+            depth: Analysis depth
+
+        Returns:
+            List of LLM-discovered inefficiencies
+        """
         # TODO: Implement LLM-based pattern analysis
         # This will use the LLM to understand complex patterns and suggest optimizations
-        
+
         # Placeholder for LLM analysis
         return []
     
     def _prioritize_inefficiencies(
-        self, inefficiencies: List[Dict[str, Any]]
+        self,
+        inefficiencies: List[Dict[str, Any]],
+        columns: Optional[_FindingColumns] = None
     ) -> List[Dict[str, Any]]:
         """
         Prioritize inefficiencies by severity and potential impact.
-        
+
         Args:
             inefficiencies: List of inefficiency findings
-            
+            columns: Optional precomputed key columns (built here for
+                large lists when not supplied)
+
         Returns:
             Prioritized list (critical -> high -> medium -> low)
         """
-        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        
-        return sorted(
-            inefficiencies,
-            key=lambda x: (
-                severity_order.get(x.get("severity", "low"), 3),
-                -x.get("potential_savings", 0)  # Higher savings first within same severity
+        # Large finding lists: use precomputed integer rank and savings
+        # key columns and let lexsort order them at C level (stable,
+        # ranks primary, higher savings first within a rank) instead of
+        # paying a Python tuple comparison per sort step.
+        if columns is None and len(inefficiencies) >= _VECTORIZE_MIN_FINDINGS:
+            columns = _finding_columns(inefficiencies)
+        if columns is not None:
+            order = np.lexsort((-columns.savings, columns.ranks))
+            return [inefficiencies[i] for i in order]
+
+        # Decorate-sort-undecorate: compute each finding's sort key once up
+        # front so the sort compares plain tuples of numbers instead of doing
+        # two dict lookups per comparison. The index keeps the sort stable and
+        # prevents comparisons from ever reaching the finding dicts.
+        decorated = [
+            (
+                SEVERITY_RANK.get(finding.get("severity", "low"), 3),
+                # Higher savings first within same severity; `or 0`
+                # matches the column path's treatment of None
+                -(finding.get("potential_savings", 0) or 0),
+                index,
+                finding
             )
-        )
+            for index, finding in enumerate(inefficiencies)
+        ]
+        decorated.sort()
+        return [entry[3] for entry in decorated]
     
-    def _estimate_savings(self, inefficiencies: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _estimate_savings(
+        self,
+        inefficiencies: List[Dict[str, Any]],
+        columns: Optional[_FindingColumns] = None
+    ) -> Dict[str, Any]:
         """
         Estimate potential cost savings from addressing inefficiencies.
-        
+
         Args:
             inefficiencies: List of inefficiency findings
-            
+            columns: Optional precomputed key columns (built here for
+                large lists when not supplied)
+
         Returns:
             Dictionary with savings estimates
         """
         currency = self.config.get("cost_estimation", {}).get("currency", "USD")
-        total_savings = sum(i.get("potential_savings", 0) for i in inefficiencies)
-        
-        by_category = {}
-        for inefficiency in inefficiencies:
-            category = inefficiency.get("category", "other")
-            if category not in by_category:
-                by_category[category] = 0
-            by_category[category] += inefficiency.get("potential_savings", 0)
-        
+
+        if columns is None and len(inefficiencies) >= _VECTORIZE_MIN_FINDINGS:
+            columns = _finding_columns(inefficiencies)
+        if columns is not None:
+            # Large finding sets: do the reduction in NumPy so per-element
+            # work happens in C instead of the bytecode interpreter.
+            totals = np.bincount(columns.category_inverse, weights=columns.savings)
+            total_savings = float(columns.savings.sum())
+            by_category = dict(zip(columns.category_unique.tolist(), totals.tolist()))
+        else:
+            # Accumulate the total and the per-category breakdown in one pass
+            total_savings = 0.0
+            by_category: Dict[str, float] = defaultdict(float)
+            for inefficiency in inefficiencies:
+                # `or 0` matches the array path's treatment of None
+                savings = inefficiency.get("potential_savings", 0) or 0
+                total_savings += savings
+                by_category[inefficiency.get("category", "other")] += savings
+            by_category = dict(by_category)
+
         return {
             "total_monthly_savings": total_savings,
             "total_annual_savings": total_savings * 12,
@@ -420,24 +751,29 @@ class EfficiencyAnalyzerAgent(BaseAgent):
         Returns:
             List of recommendations
         """
-        recommendations = []
-        
-        # Group by type and create consolidated recommendations
-        by_type = {}
+        # Group by type and create consolidated recommendations: one pass
+        # that accumulates the savings total alongside the grouping, so the
+        # grouped issues aren't re-scanned when building the output.
+        by_type: Dict[str, List[Any]] = defaultdict(list)
+        savings_by_type: Dict[str, float] = defaultdict(float)
         for inefficiency in inefficiencies:
             issue_type = inefficiency.get("type")
-            if issue_type not in by_type:
-                by_type[issue_type] = []
             by_type[issue_type].append(inefficiency)
-        
-        for issue_type, issues in by_type.items():
-            total_savings = sum(i.get("potential_savings", 0) for i in issues)
-            recommendations.append({
+            savings_by_type[issue_type] += inefficiency.get("potential_savings", 0)
+
+        return [
+            {
                 "type": issue_type,
                 "count": len(issues),
-                "total_potential_savings": total_savings,
+                "total_potential_savings": savings_by_type[issue_type],
                 "action": issues[0].get("recommendation"),
-                "affected_resources": [i.get("resource_id") for i in issues]
-            })
-        
-        return recommendations
+                # Order-preserving dedup: the same resource can surface
+                # multiple findings of one type, and duplicate IDs balloon
+                # downstream reports
+                "affected_resources": list(dict.fromkeys(
+                    i.get("resource_id") for i in issues
+                    if i.get("resource_id") is not None
+                ))
+            }
+            for issue_type, issues in by_type.items()
+        ]
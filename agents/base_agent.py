@@ -9,6 +9,23 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Coerce NumPy scalars/arrays for the stdlib json fallback.
+
+    Duck-typed on .item()/.tolist() so this module stays import-light
+    and doesn't depend on numpy directly.
+    """
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class AgentStatus(Enum):
@@ -19,14 +36,43 @@ class AgentStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentResult:
-    """Result returned by an agent after processing"""
+    """Result returned by an agent after processing.
+
+    Slotted and frozen: one result is created per agent call (thousands
+    during batch simulations), so dropping the per-instance __dict__
+    roughly halves the footprint and speeds up field access; freezing
+    keeps results safe to share between orchestrator and consumers.
+    """
     success: bool
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the result to compact JSON bytes.
+
+        Uses orjson's C encoder when installed and emits no indentation:
+        on large payloads indented JSON is ~40% bigger and noticeably
+        slower to encode and decode. Callers that want human-readable
+        output can json.loads + re-dump; internal logging/transport
+        should go through this method.
+        """
+        payload = {
+            "success": self.success,
+            "data": self.data,
+            "error": self.error,
+            "metadata": self.metadata
+        }
+        if orjson is not None:
+            # OPT_SERIALIZE_NUMPY: simulation payloads carry NumPy
+            # scalars/arrays after vectorization; serialize them natively
+            # instead of requiring per-value float() casts upstream
+            return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(payload, separators=(",", ":"), default=_json_default).encode()
+
 
 class BaseAgent(ABC):
     """
@@ -35,7 +81,11 @@ class BaseAgent(ABC):
     All specialized agents (Architecture Reader, Efficiency Analyzer, etc.)
     must inherit from this class and implement the required methods.
     """
-    
+
+    # Slots for the base attributes; subclasses without __slots__ still
+    # get a __dict__ for their own state
+    __slots__ = ("agent_id", "name", "description", "status", "_llm_client")
+
     def __init__(self, agent_id: str, name: str, description: str):
         """
         Initialize the base agent.
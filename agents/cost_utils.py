@@ -4,6 +4,26 @@ Utility functions for cost calculations and conversions
 
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
+from functools import lru_cache
+import numpy as np
+
+
+# Hoisted to module scope so format_cost doesn't rebuild it per call
+_CURRENCY_SYMBOLS = {
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "JPY": "¥",
+    "CAD": "C$",
+    "AUD": "A$"
+}
+
+
+@lru_cache(maxsize=64)
+def _cost_template(symbol: str, decimal_places: int) -> str:
+    """Precompiled format template for a (symbol, decimals) pair, so the
+    format spec is parsed once per pair instead of on every call"""
+    return symbol + "{:,." + str(decimal_places) + "f}"
 
 
 def calculate_monthly_to_annual(monthly_cost: float) -> float:
@@ -56,6 +76,55 @@ def calculate_savings_percentage(original: float, new: float) -> float:
     return ((original - new) / original) * 100.0
 
 
+def apply_percentage_change_arr(base_costs: np.ndarray, percentage: float) -> np.ndarray:
+    """
+    Array version of apply_percentage_change.
+
+    Args:
+        base_costs: Array of base cost amounts
+        percentage: Percentage change (positive for increase, negative for decrease)
+
+    Returns:
+        Array of new costs after percentage change
+    """
+    return np.asarray(base_costs, dtype=np.float64) * (1 + percentage / 100.0)
+
+
+def apply_discount_arr(costs: np.ndarray, discount_percentage: float) -> np.ndarray:
+    """
+    Array version of apply_discount.
+
+    Args:
+        costs: Array of original costs
+        discount_percentage: Discount percentage (e.g., 30 for 30% off)
+
+    Returns:
+        Array of costs after discount
+    """
+    return np.asarray(costs, dtype=np.float64) * (1 - discount_percentage / 100.0)
+
+
+def calculate_savings_percentage_arr(
+    original: np.ndarray, new: np.ndarray
+) -> np.ndarray:
+    """
+    Array version of calculate_savings_percentage.
+
+    Args:
+        original: Array of original costs
+        new: Array of new costs
+
+    Returns:
+        Array of percentage savings (0 where the original cost is 0)
+    """
+    original = np.asarray(original, dtype=np.float64)
+    new = np.asarray(new, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            original != 0, (original - new) / original * 100.0, 0.0
+        )
+
+
 def format_cost(cost: float, currency: str = "USD", decimal_places: int = 2) -> str:
     """
     Format cost with currency symbol.
@@ -68,17 +137,8 @@ def format_cost(cost: float, currency: str = "USD", decimal_places: int = 2) ->
     Returns:
         Formatted cost string
     """
-    currency_symbols = {
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "JPY": "¥",
-        "CAD": "C$",
-        "AUD": "A$"
-    }
-    
-    symbol = currency_symbols.get(currency, currency)
-    return f"{symbol}{cost:,.{decimal_places}f}"
+    symbol = _CURRENCY_SYMBOLS.get(currency, currency)
+    return _cost_template(symbol, decimal_places).format(cost)
 
 
 def calculate_total_cost_breakdown(breakdown: Dict[str, float]) -> Dict[str, Any]:
@@ -91,50 +151,61 @@ def calculate_total_cost_breakdown(breakdown: Dict[str, float]) -> Dict[str, Any
     Returns:
         Dictionary with totals and percentages
     """
-    total = sum(breakdown.values())
-    
-    percentages = {
-        category: (cost / total * 100) if total > 0 else 0
-        for category, cost in breakdown.items()
-    }
-    
+    # One vectorized divide + argmax instead of a per-category Python
+    # division and a keyed max() scan — this runs once per scenario in
+    # comparisons, so it adds up for large sweeps.
+    categories = list(breakdown)
+    values = np.fromiter(breakdown.values(), dtype=np.float64, count=len(breakdown))
+    total = float(values.sum())
+
+    if total > 0:
+        percentages = dict(zip(categories, (values / total * 100).tolist()))
+    else:
+        percentages = dict.fromkeys(categories, 0)
+
     return {
         "total": total,
         "breakdown": breakdown,
         "percentages": percentages,
-        "largest_category": max(breakdown.items(), key=lambda x: x[1])[0] if breakdown else None
+        "largest_category": categories[int(values.argmax())] if categories else None
     }
 
 
 def project_costs_over_time(
     base_monthly_cost: float,
     months: int,
-    growth_rate: Optional[float] = None
+    growth_rate: Optional[float] = None,
+    return_series: bool = True
 ) -> Dict[str, Any]:
     """
     Project costs over multiple months with optional growth.
-    
+
+    The geometric growth series is computed in closed form with NumPy
+    (base * (1+g)**arange(months)) instead of a Python loop, so long
+    horizons and repeated scenario sweeps stay cheap.
+
     Args:
         base_monthly_cost: Starting monthly cost
         months: Number of months to project
         growth_rate: Optional monthly growth rate (as decimal, e.g., 0.01 for 1%)
-        
+        return_series: Build the per-month projection dicts; pass False
+            when only the totals are needed to skip that allocation
+
     Returns:
         Dictionary with monthly projections and totals
     """
-    monthly_costs = []
-    current_cost = base_monthly_cost
-    
-    for month in range(months):
-        monthly_costs.append({
-            "month": month + 1,
-            "cost": current_cost
-        })
-        if growth_rate:
-            current_cost = current_cost * (1 + growth_rate)
-    
-    total_cost = sum(m["cost"] for m in monthly_costs)
-    
+    costs = base_monthly_cost * np.power(
+        1.0 + (growth_rate or 0.0), np.arange(months, dtype=np.float64)
+    )
+    total_cost = float(costs.sum())
+
+    monthly_costs = None
+    if return_series:
+        monthly_costs = [
+            {"month": month + 1, "cost": cost}
+            for month, cost in enumerate(costs.tolist())
+        ]
+
     return {
         "monthly_projections": monthly_costs,
         "total_cost": total_cost,
@@ -0,0 +1,71 @@
+"""
+Content-addressed cache for LLM responses
+
+LLM calls are the most expensive and highest-latency operations in the
+pipeline. Responses are cached under a SHA-256 key derived from the exact
+inputs (document bytes, architecture blob, model id), so re-running an
+analysis on unchanged input turns a multi-second network call into a
+dictionary lookup. Expired entries are kept as a stale fallback so an LLM
+outage degrades to slightly old results instead of a failed analysis.
+"""
+
+from typing import Any, Optional, Tuple
+import hashlib
+import json
+import time
+
+
+class LLMResponseCache:
+    """In-process TTL cache for LLM responses, keyed by content hash."""
+
+    def __init__(self, ttl: float = 3600.0, maxsize: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds before an entry is considered stale
+            maxsize: Maximum number of entries before oldest-first eviction
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict = {}  # key -> (timestamp, value)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from arbitrary inputs.
+
+        Bytes are hashed as-is; everything else is canonicalized through
+        JSON with sorted keys so dict ordering doesn't change the key.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, bytes):
+                digest.update(part)
+            else:
+                digest.update(
+                    json.dumps(part, sort_keys=True, default=str).encode()
+                )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[bool, Any]]:
+        """
+        Look up a key.
+
+        Returns:
+            None on a miss, otherwise (is_fresh, value). Stale entries are
+            returned with is_fresh=False so callers can use them as a
+            fallback when the live LLM call fails.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        timestamp, value = entry
+        return (time.monotonic() - timestamp < self.ttl, value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full"""
+        if len(self._entries) >= self.maxsize and key not in self._entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+        self._entries[key] = (time.monotonic(), value)
@@ -8,6 +8,9 @@ It manages agent dependencies, execution order, and data flow between agents.
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
+from graphlib import TopologicalSorter, CycleError
+from collections import ChainMap, deque
+from types import MappingProxyType
 import asyncio
 from agents.base_agent import BaseAgent, AgentResult, AgentStatus
 
@@ -21,9 +24,15 @@ class WorkflowStatus(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentTask:
-    """Represents a task for an agent in the workflow"""
+    """Represents a task for an agent in the workflow.
+
+    Slotted and frozen: tasks are created once per workflow and only
+    read by the scheduler, so dropping the per-instance __dict__ saves
+    memory on large workflows and freezing makes tasks safe to share
+    across concurrent runs.
+    """
     agent: BaseAgent
     agent_id: str
     dependencies: List[str]  # List of agent_ids this task depends on
@@ -41,13 +50,44 @@ class Orchestrator:
     - Workflow status tracking
     """
     
-    def __init__(self):
-        """Initialize the orchestrator"""
+    def __init__(self, max_concurrency: int = 10):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            max_concurrency: Maximum number of agents processing at once.
+                Caps in-flight work on wide fan-out layers so a broad DAG
+                can't flood the event loop or downstream API rate limits.
+        """
+        self.max_concurrency = max_concurrency
+        self._sem = asyncio.Semaphore(max_concurrency)
         self.agents: Dict[str, BaseAgent] = {}
         self.workflow: List[AgentTask] = []
+        # agent_id -> task lookup, kept in sync with self.workflow so the
+        # scheduler and validator never have to scan the task list
+        self._task_by_id: Dict[str, AgentTask] = {}
+        # agent_id -> precomputed (dep_id, output_key, input_key) triples
+        # for tasks with an explicit input_mapping; built lazily and
+        # dropped whenever the workflow changes
+        self._input_plans: Dict[str, List[tuple]] = {}
+        # agent_id -> read-only view over that agent's result data; lets
+        # fan-out consumers share one payload without copying it
+        self._data_views: Dict[str, Any] = {}
+        # Validated dependency graph cached per workflow fingerprint, so
+        # repeated execute() calls on an unchanged workflow skip the
+        # validation pass and graph rebuild
+        self._workflow_fp: Optional[tuple] = None
+        self._graph: Optional[Dict[str, tuple]] = None
         self.status = WorkflowStatus.PENDING
         self.results: Dict[str, AgentResult] = {}
-        self.execution_log: List[Dict[str, Any]] = []
+        # Bounded log reused across runs (cleared, not reallocated) so a
+        # long-lived orchestrator rerunning audits doesn't churn the GC
+        # or grow without limit
+        self.execution_log: deque = deque(maxlen=10_000)
+        # Event-loop handle captured once per execute; _log_execution
+        # reads timestamps from it instead of re-resolving the loop
+        # through the policy machinery on every log event
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     def register_agent(self, agent: BaseAgent) -> None:
         """
@@ -57,6 +97,7 @@ class Orchestrator:
             agent: The agent instance to register
         """
         self.agents[agent.agent_id] = agent
+        self._workflow_fp = None
     
     def add_task(
         self,
@@ -82,6 +123,9 @@ class Orchestrator:
             input_mapping=input_mapping or {}
         )
         self.workflow.append(task)
+        self._task_by_id[agent_id] = task
+        self._input_plans.clear()
+        self._workflow_fp = None
     
     def _build_input_data(self, task: AgentTask) -> Dict[str, Any]:
         """
@@ -93,68 +137,59 @@ class Orchestrator:
         Returns:
             Dictionary of input data for the agent
         """
-        input_data = {}
-        
-        for dep_id in task.dependencies:
-            if dep_id not in self.results:
-                raise ValueError(f"Dependency {dep_id} has no result")
-            
-            dep_result = self.results[dep_id]
-            if not dep_result.success:
-                raise ValueError(f"Dependency {dep_id} failed: {dep_result.error}")
-            
-            # Map outputs from dependency to inputs for this task
-            if dep_result.data:
-                if task.input_mapping:
-                    # Use explicit mapping
-                    for output_key, input_key in task.input_mapping.items():
-                        if output_key in dep_result.data:
-                            input_data[input_key] = dep_result.data[output_key]
-                else:
-                    # Pass all data through
-                    input_data.update(dep_result.data)
-        
-        return input_data
+        # The scheduler only builds inputs for tasks whose dependencies
+        # all completed successfully (failures short-circuit the run), so
+        # no per-dependency existence/success checks are needed here.
+        if not task.dependencies:
+            return {}
+
+        results = self.results
+
+        if task.input_mapping:
+            # Static (dep, output_key, input_key) triples are expanded
+            # once per workflow; each call only does the dynamic part —
+            # checking which outputs the dependency actually produced
+            plan = self._input_plans.get(task.agent_id)
+            if plan is None:
+                plan = [
+                    (dep_id, output_key, input_key)
+                    for dep_id in task.dependencies
+                    for output_key, input_key in task.input_mapping.items()
+                ]
+                self._input_plans[task.agent_id] = plan
+
+            return {
+                input_key: results[dep_id].data[output_key]
+                for dep_id, output_key, input_key in plan
+                if results[dep_id].data and output_key in results[dep_id].data
+            }
+
+        # Pass all dependency data through as read-only views: a single
+        # dependency hands out the producer's payload directly, several
+        # are layered in a ChainMap (reversed so later dependencies
+        # shadow earlier ones, matching the old update() merge order).
+        # Either way the payload — often a large architecture dict — is
+        # shared, not copied, no matter how many consumers fan out.
+        views = self._data_views
+        if len(task.dependencies) == 1:
+            return views[task.dependencies[0]]
+        return ChainMap(*[views[dep_id] for dep_id in reversed(task.dependencies)])
     
     def _validate_workflow(self) -> tuple[bool, Optional[str]]:
         """
         Validate that the workflow is properly structured.
-        
+
+        Thin wrapper over _topological_sort, which performs both the
+        missing-dependency and cycle checks while building the sorter;
+        running a separate DFS here would just repeat that work.
+
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Check for circular dependencies
-        agent_ids = {task.agent_id for task in self.workflow}
-        
-        for task in self.workflow:
-            for dep_id in task.dependencies:
-                if dep_id not in agent_ids:
-                    return False, f"Dependency {dep_id} not found in workflow"
-        
-        # Simple cycle detection (can be enhanced)
-        visited = set()
-        
-        def has_cycle(agent_id: str, path: set) -> bool:
-            if agent_id in path:
-                return True
-            if agent_id in visited:
-                return False
-            
-            visited.add(agent_id)
-            path.add(agent_id)
-            
-            task = next((t for t in self.workflow if t.agent_id == agent_id), None)
-            if task:
-                for dep_id in task.dependencies:
-                    if has_cycle(dep_id, path.copy()):
-                        return True
-            
-            return False
-        
-        for task in self.workflow:
-            if has_cycle(task.agent_id, set()):
-                return False, f"Circular dependency detected involving {task.agent_id}"
-        
+        try:
+            self._topological_sort()
+        except ValueError as e:
+            return False, str(e)
         return True, None
     
     async def execute(self, initial_input: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -167,103 +202,178 @@ class Orchestrator:
         Returns:
             Dictionary containing all results from the workflow
         """
-        # Validate workflow
-        is_valid, error = self._validate_workflow()
-        if not is_valid:
+        # Building the sorter validates as it goes (missing deps and
+        # cycles), so there is no separate validation pass
+        try:
+            sorter = self._topological_sort()
+        except ValueError as e:
             self.status = WorkflowStatus.FAILED
-            raise ValueError(f"Invalid workflow: {error}")
-        
+            raise ValueError(f"Invalid workflow: {e}") from e
+
         self.status = WorkflowStatus.RUNNING
-        self.results = {}
-        self.execution_log = []
+        self._loop = asyncio.get_running_loop()
+        self.results.clear()
+        self.execution_log.clear()
         
+        self._data_views.clear()
+
         if initial_input:
             # Store initial input as a special result
             self.results["__initial__"] = AgentResult(
                 success=True,
                 data=initial_input
             )
-        
-        # Topological sort to determine execution order
-        execution_order = self._topological_sort()
-        
+            self._data_views["__initial__"] = MappingProxyType(initial_input)
+
+        # Asynchronous scheduler over the topological sorter: dispatch
+        # every task whose dependencies are satisfied concurrently and
+        # admit dependents as their producers finish. Wall time tracks
+        # the critical path of the DAG rather than the sum of all agent
+        # runtimes.
+        pending: Dict[asyncio.Task, str] = {}
+        ready: deque = deque()
+
         try:
-            for agent_id in execution_order:
-                task = next(t for t in self.workflow if t.agent_id == agent_id)
-                
-                # Build input data
-                input_data = self._build_input_data(task)
-                
-                # Execute agent
-                self._log_execution(agent_id, "starting", input_data)
-                task.agent.set_status(AgentStatus.PROCESSING)
-                
-                result = await task.agent.process(input_data)
-                
-                task.agent.set_status(
-                    AgentStatus.COMPLETED if result.success else AgentStatus.ERROR
+            while sorter.is_active():
+                # Dispatch ready tasks up to the concurrency cap; the
+                # rest stay buffered until an in-flight agent finishes
+                ready.extend(sorter.get_ready())
+                while ready and len(pending) < self.max_concurrency:
+                    agent_id = ready.popleft()
+                    task = self._task_by_id[agent_id]
+
+                    input_data = self._build_input_data(task)
+
+                    self._log_execution(agent_id, "starting", input_data)
+                    task.agent.set_status(AgentStatus.PROCESSING)
+
+                    pending[asyncio.create_task(self._run_limited(task, input_data))] = agent_id
+
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                
-                self.results[agent_id] = result
-                self._log_execution(agent_id, "completed", result)
-                
-                if not result.success:
-                    self.status = WorkflowStatus.FAILED
-                    return {
-                        "status": "failed",
-                        "failed_at": agent_id,
-                        "error": result.error,
-                        "results": self.results
-                    }
-            
+
+                for future in done:
+                    agent_id = pending.pop(future)
+                    task = self._task_by_id[agent_id]
+                    result = future.result()
+
+                    task.agent.set_status(
+                        AgentStatus.COMPLETED if result.success else AgentStatus.ERROR
+                    )
+
+                    self.results[agent_id] = result
+                    self._data_views[agent_id] = MappingProxyType(result.data or {})
+                    self._log_execution(agent_id, "completed", result)
+
+                    if not result.success:
+                        # Preserve the serial short-circuit: stop the run
+                        # on first failure and drop in-flight work
+                        await self._cancel_pending(pending)
+                        self.status = WorkflowStatus.FAILED
+                        return {
+                            "status": "failed",
+                            "failed_at": agent_id,
+                            "error": result.error,
+                            "results": dict(self.results)
+                        }
+
+                    # Producer finished: the sorter moves any dependents
+                    # whose last dependency this was into the ready set
+                    sorter.done(agent_id)
+
             self.status = WorkflowStatus.COMPLETED
+            # Snapshot the reused containers: the next run clears them in
+            # place, and callers holding a previous run's payload must
+            # not see it emptied out from under them. O(#agents) per run,
+            # negligible next to reusing the backing stores.
             return {
                 "status": "completed",
-                "results": self.results,
-                "execution_log": self.execution_log
+                "results": dict(self.results),
+                "execution_log": list(self.execution_log)
             }
-        
+
         except Exception as e:
+            await self._cancel_pending(pending)
             self.status = WorkflowStatus.FAILED
             return {
                 "status": "failed",
                 "error": str(e),
-                "results": self.results
+                "results": dict(self.results)
             }
     
-    def _topological_sort(self) -> List[str]:
+    @staticmethod
+    async def _cancel_pending(pending: Dict[asyncio.Task, str]) -> None:
+        """Cancel in-flight agent tasks and wait for them to unwind.
+
+        Cancelling without awaiting would leave the coroutines to die
+        during garbage collection — mid-API-call, with "task was never
+        retrieved" warnings; draining here reclaims their work cleanly
+        before the failed-run result is returned.
         """
-        Perform topological sort to determine execution order.
-        
+        if not pending:
+            return
+        for outstanding in pending:
+            outstanding.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run_limited(self, task: AgentTask, input_data: Dict[str, Any]) -> AgentResult:
+        """Run one agent under the concurrency semaphore.
+
+        The dispatch loop already respects max_concurrency; the semaphore
+        additionally guards against nested or re-entrant execute calls
+        sharing this orchestrator.
+        """
+        async with self._sem:
+            return await task.agent.process(input_data)
+
+    def _topological_sort(self) -> TopologicalSorter:
+        """
+        Build a prepared topological sorter over the workflow.
+
+        graphlib's C-backed sorter replaces the hand-rolled Kahn's
+        algorithm (whose queue.pop(0) was O(N) per pop), and its
+        get_ready()/done() API natively expresses the ready batches the
+        concurrent scheduler consumes.
+
         Returns:
-            List of agent_ids in execution order
+            A prepared TopologicalSorter over agent_ids
+
+        Raises:
+            ValueError: If a dependency is missing from the workflow or
+                the workflow has circular dependencies
         """
-        # Build dependency graph
-        in_degree = {task.agent_id: len(task.dependencies) for task in self.workflow}
-        graph = {task.agent_id: [] for task in self.workflow}
-        
+        fingerprint = tuple(
+            (task.agent_id, tuple(task.dependencies)) for task in self.workflow
+        )
+
+        if fingerprint == self._workflow_fp and self._graph is not None:
+            # Unchanged workflow: the cached graph is already validated,
+            # so skip the membership checks and cycle translation. A
+            # fresh sorter is still needed — a prepared sorter is
+            # consumed by the run that drives it.
+            sorter = TopologicalSorter(self._graph)
+            sorter.prepare()
+            return sorter
+
+        graph: Dict[str, tuple] = {}
         for task in self.workflow:
+            # Missing-dependency check folded into the graph build, so
+            # validation doesn't need its own pass over the workflow
             for dep_id in task.dependencies:
-                if dep_id in graph:
-                    graph[dep_id].append(task.agent_id)
-        
-        # Kahn's algorithm
-        queue = [agent_id for agent_id, degree in in_degree.items() if degree == 0]
-        result = []
-        
-        while queue:
-            agent_id = queue.pop(0)
-            result.append(agent_id)
-            
-            for dependent in graph[agent_id]:
-                in_degree[dependent] -= 1
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
-        
-        if len(result) != len(self.workflow):
-            raise ValueError("Workflow has circular dependencies")
-        
-        return result
+                if dep_id not in self._task_by_id:
+                    raise ValueError(f"Dependency {dep_id} not found in workflow")
+            graph[task.agent_id] = tuple(task.dependencies)
+
+        sorter = TopologicalSorter(graph)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise ValueError("Workflow has circular dependencies") from e
+
+        self._workflow_fp = fingerprint
+        self._graph = graph
+        return sorter
     
     def _log_execution(self, agent_id: str, event: str, data: Any) -> None:
         """Log an execution event"""
@@ -271,7 +381,7 @@ class Orchestrator:
             "agent_id": agent_id,
             "event": event,
             "data": data,
-            "timestamp": asyncio.get_event_loop().time() if asyncio.get_event_loop().is_running() else None
+            "timestamp": self._loop.time() if self._loop is not None else None
         })
     
     def get_status(self) -> WorkflowStatus:
@@ -281,8 +391,8 @@ class Orchestrator:
     def reset(self) -> None:
         """Reset the orchestrator to initial state"""
         self.status = WorkflowStatus.PENDING
-        self.results = {}
-        self.execution_log = []
+        self.results.clear()
+        self.execution_log.clear()
         for agent in self.agents.values():
             agent.set_status(AgentStatus.IDLE)
 
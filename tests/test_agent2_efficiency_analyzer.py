@@ -2,7 +2,10 @@
 Tests for Agent 2: Efficiency Analyzer
 """
 
+import random
+
 import pytest
+import agents.agent2_efficiency_analyzer as analyzer_module
 from agents.agent2_efficiency_analyzer import EfficiencyAnalyzerAgent
 from agents.base_agent import AgentStatus
 
@@ -196,8 +199,116 @@ class TestEfficiencyAnalyzerAgent:
     async def test_process_invalid_input(self, agent):
         """Test processing with invalid input"""
         result = await agent.process({})
-        
+
         assert not result.success
         assert "error" in result or result.error is not None
         assert agent.get_status() == AgentStatus.ERROR
 
+
+class TestVectorizedPathEquivalence:
+    """The _analyze_* and aggregation helpers switch to array paths above
+    a resource-count threshold; these tests build fleets large enough to
+    cross it and assert the array paths emit exactly what the scalar
+    paths do."""
+
+    @pytest.fixture
+    def agent(self):
+        """Create an instance of EfficiencyAnalyzerAgent"""
+        return EfficiencyAnalyzerAgent()
+
+    @staticmethod
+    def _build_fleet(seed, count=1500):
+        """Deterministic synthetic fleet above the vectorization cutoff"""
+        rng = random.Random(seed)
+        instances = [
+            {
+                "id": f"i-{n}",
+                "instance_type": rng.choice(
+                    ["t2.micro", "t2.large", "m5.2xlarge", "m5.8xlarge", ""]
+                ),
+                "monthly_cost": round(rng.uniform(5, 500), 2),
+                "utilization": rng.choice([
+                    None,
+                    {"cpu": rng.randint(0, 100), "memory": rng.randint(0, 100)},
+                    {
+                        "cpu": round(rng.uniform(0, 100), 4),
+                        "memory": round(rng.uniform(0, 100), 4)
+                    }
+                ])
+            }
+            for n in range(count)
+        ]
+        buckets = [
+            {
+                "id": f"bucket-{n}",
+                "size_gb": rng.choice([0, 10, 500]),
+                "last_accessed_days_ago": rng.randint(0, 400),
+                "monthly_cost": round(rng.uniform(1, 50), 2)
+            }
+            for n in range(count)
+        ]
+        return instances, buckets
+
+    @staticmethod
+    def _as_dicts(findings):
+        return [f.to_dict() for f in findings]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    async def test_analyze_compute_vector_matches_scalar(self, agent, monkeypatch, seed):
+        """Vectorized compute check emits the same findings in the same order"""
+        instances, _ = self._build_fleet(seed)
+        assert len(instances) >= analyzer_module._VECTORIZE_MIN_RESOURCES
+
+        vectorized = await agent._analyze_compute({"instances": instances})
+
+        monkeypatch.setattr(analyzer_module, "_VECTORIZE_MIN_RESOURCES", 10 ** 9)
+        scalar = await agent._analyze_compute({"instances": instances})
+
+        assert self._as_dicts(vectorized) == self._as_dicts(scalar)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    async def test_analyze_storage_vector_matches_scalar(self, agent, monkeypatch, seed):
+        """Vectorized storage check emits the same findings in the same order"""
+        _, buckets = self._build_fleet(seed)
+        assert len(buckets) >= analyzer_module._VECTORIZE_MIN_RESOURCES
+
+        vectorized = await agent._analyze_storage({"buckets": buckets})
+
+        monkeypatch.setattr(analyzer_module, "_VECTORIZE_MIN_RESOURCES", 10 ** 9)
+        scalar = await agent._analyze_storage({"buckets": buckets})
+
+        assert self._as_dicts(vectorized) == self._as_dicts(scalar)
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_aggregates_vector_match_scalar(self, agent, monkeypatch, seed):
+        """Column-based prioritization and savings estimation match the
+        scalar paths on a large finding list"""
+        rng = random.Random(seed)
+        findings = [
+            {
+                "severity": rng.choice(["critical", "high", "medium", "low", "unknown"]),
+                "potential_savings": rng.choice([None, 0, 12.5, 80.0, 250.0]),
+                "category": rng.choice(["compute", "storage", "networking"]),
+                "marker": n
+            }
+            for n in range(1500)
+        ]
+        assert len(findings) >= analyzer_module._VECTORIZE_MIN_FINDINGS
+
+        vector_order = agent._prioritize_inefficiencies(findings)
+        vector_savings = agent._estimate_savings(findings)
+
+        monkeypatch.setattr(analyzer_module, "_VECTORIZE_MIN_FINDINGS", 10 ** 9)
+        scalar_order = agent._prioritize_inefficiencies(findings)
+        scalar_savings = agent._estimate_savings(findings)
+
+        assert vector_order == scalar_order
+        assert vector_savings["total_monthly_savings"] == pytest.approx(
+            scalar_savings["total_monthly_savings"]
+        )
+        assert vector_savings["by_category"].keys() == scalar_savings["by_category"].keys()
+        for category, total in scalar_savings["by_category"].items():
+            assert vector_savings["by_category"][category] == pytest.approx(total)
+
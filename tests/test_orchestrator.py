@@ -0,0 +1,159 @@
+"""
+Tests for the Orchestrator
+"""
+
+import asyncio
+
+import pytest
+from orchestrator import Orchestrator, WorkflowStatus
+from agents.base_agent import BaseAgent, AgentResult
+
+
+class StubAgent(BaseAgent):
+    """Minimal agent that records its inputs and returns fixed data"""
+
+    def __init__(self, agent_id, data=None, delay=0.0, fail=False):
+        super().__init__(agent_id, agent_id, f"Stub agent {agent_id}")
+        self.data = data or {}
+        self.delay = delay
+        self.fail = fail
+        self.received = None
+        self.cancelled = False
+        self.started_at = None
+        self.finished_at = None
+
+    def get_required_inputs(self):
+        return []
+
+    async def process(self, input_data):
+        loop = asyncio.get_running_loop()
+        self.started_at = loop.time()
+        self.received = dict(input_data)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        finally:
+            self.finished_at = loop.time()
+        if self.fail:
+            return AgentResult(success=False, error="stub failure")
+        return AgentResult(success=True, data=self.data)
+
+
+class TestOrchestrator:
+    """Test suite for the concurrent workflow scheduler"""
+
+    @pytest.mark.asyncio
+    async def test_diamond_dag_completes(self):
+        """A diamond DAG runs every task and merges dependency data,
+        with later dependencies shadowing earlier ones"""
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(StubAgent("a", data={"shared": "from_a", "only_a": 1}))
+        orchestrator.register_agent(StubAgent("b", data={"shared": "from_b"}))
+        orchestrator.register_agent(StubAgent("c"))
+        orchestrator.add_task("a")
+        orchestrator.add_task("b", dependencies=["a"])
+        orchestrator.add_task("c", dependencies=["a", "b"])
+
+        outcome = await orchestrator.execute()
+
+        assert outcome["status"] == "completed"
+        assert orchestrator.get_status() == WorkflowStatus.COMPLETED
+        assert set(outcome["results"]) == {"a", "b", "c"}
+        # c depends on a then b: b's value shadows a's, a-only keys remain
+        assert orchestrator.agents["c"].received == {"shared": "from_b", "only_a": 1}
+
+    @pytest.mark.asyncio
+    async def test_input_mapping_extracts_and_renames(self):
+        """An explicit input_mapping pulls only the mapped keys"""
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(
+            StubAgent("producer", data={"architecture": {"x": 1}, "extra": 2})
+        )
+        orchestrator.register_agent(StubAgent("consumer"))
+        orchestrator.add_task("producer")
+        orchestrator.add_task(
+            "consumer",
+            dependencies=["producer"],
+            input_mapping={"architecture": "arch", "missing_key": "never_set"}
+        )
+
+        outcome = await orchestrator.execute()
+
+        assert outcome["status"] == "completed"
+        assert orchestrator.agents["consumer"].received == {"arch": {"x": 1}}
+
+    @pytest.mark.asyncio
+    async def test_first_failure_cancels_in_flight_sibling(self):
+        """A failing agent short-circuits the run and cancels slower
+        in-flight siblings instead of waiting them out"""
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(StubAgent("failing", fail=True))
+        orchestrator.register_agent(StubAgent("slow", delay=5.0))
+        orchestrator.register_agent(StubAgent("downstream"))
+        orchestrator.add_task("failing")
+        orchestrator.add_task("slow")
+        orchestrator.add_task("downstream", dependencies=["failing"])
+
+        outcome = await asyncio.wait_for(orchestrator.execute(), timeout=1.0)
+
+        assert outcome["status"] == "failed"
+        assert outcome["failed_at"] == "failing"
+        assert orchestrator.get_status() == WorkflowStatus.FAILED
+        assert orchestrator.agents["slow"].cancelled
+        # The downstream task never ran
+        assert orchestrator.agents["downstream"].received is None
+        assert "downstream" not in outcome["results"]
+
+    @pytest.mark.asyncio
+    async def test_cycle_is_rejected(self):
+        """Circular dependencies fail validation and abort execution"""
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(StubAgent("a"))
+        orchestrator.register_agent(StubAgent("b"))
+        orchestrator.add_task("a", dependencies=["b"])
+        orchestrator.add_task("b", dependencies=["a"])
+
+        is_valid, error = orchestrator._validate_workflow()
+        assert not is_valid
+        assert "circular" in error.lower()
+
+        with pytest.raises(ValueError, match="Invalid workflow"):
+            await orchestrator.execute()
+        assert orchestrator.get_status() == WorkflowStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_missing_dependency_is_rejected(self):
+        """Dependencies on agents outside the workflow fail validation"""
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(StubAgent("a"))
+        orchestrator.register_agent(StubAgent("b"))
+        orchestrator.add_task("a")
+        orchestrator.add_task("b", dependencies=["ghost"])
+
+        is_valid, error = orchestrator._validate_workflow()
+        assert not is_valid
+        assert "ghost" in error
+
+        with pytest.raises(ValueError, match="ghost"):
+            await orchestrator.execute()
+
+    @pytest.mark.asyncio
+    async def test_independent_tasks_run_concurrently(self):
+        """Two independent slow tasks overlap instead of running serially"""
+        orchestrator = Orchestrator()
+        orchestrator.register_agent(StubAgent("a", delay=0.1))
+        orchestrator.register_agent(StubAgent("b", delay=0.1))
+        orchestrator.add_task("a")
+        orchestrator.add_task("b")
+
+        outcome = await orchestrator.execute()
+
+        assert outcome["status"] == "completed"
+        # The two run intervals intersect: each task started before the
+        # other finished. Serial execution can't produce this, and the
+        # check doesn't depend on wall-clock margins.
+        a, b = orchestrator.agents["a"], orchestrator.agents["b"]
+        assert a.started_at < b.finished_at
+        assert b.started_at < a.finished_at